@@ -4,6 +4,9 @@ from ..lib import Fluent, Message as M
 
 from datetime import timedelta
 
+# Run the examples below when the form is opened.
+_DEBUG = False
+
 
 class Testform(TestformTemplate):
     def __init__(self, **properties):
@@ -11,6 +14,11 @@ class Testform(TestformTemplate):
         # Set Form properties and Data Bindings.
         self.init_components(**properties)
 
+        if _DEBUG:
+            self._run_examples()
+
+    def _run_examples(self):
+        """Print translations for manually testing the library."""
         print("Preferred:", Fluent.get_preferred_locales())
         print("Preferred:", Fluent.get_preferred_locales("en_US"))
 
@@ -39,9 +47,3 @@ class Testform(TestformTemplate):
         fluent_hyphen = Fluent("localization/{locale}/main.ftl", "en-US", ["en-US", "es-MX"])
         print("hyphen: ", fluent.format("hello"))
         print("hyphen: ", fluent.format("hello", name="John"))
-
-
-
-
-
-    
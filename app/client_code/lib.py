@@ -1,4 +1,59 @@
 import anvil.js
+from functools import lru_cache
+from types import SimpleNamespace
+
+_ASSET_URL = "./_/theme/"
+_FLUENT_MODULE_URL = f"{_ASSET_URL}fluent_anvil.js"
+
+# Translation table for converting Anvil-compatible locale names to IETF tags.
+_LOCALE_TRANS = str.maketrans("_", "-")
+
+# Marks translations that are not cached yet. Fluent returns None for missing messages.
+_MISSING = object()
+
+# The imported JavaScript library, see _import_module().
+_module_cache = None
+
+
+def _import_module():
+    """Return the JavaScript library, importing it on first use only."""
+    global _module_cache
+    if _module_cache is None:
+        _module_cache = anvil.js.import_from(_FLUENT_MODULE_URL)
+    return _module_cache
+
+
+def _init_js_interface(
+    url_template: str, locale: str, fallback_locales: tuple = None
+) -> SimpleNamespace:
+    """Initialize Fluent's DOMLocalization and Localization object.
+
+    Args:
+        url_template: Template string to the .ftl files including the path prefix,
+            see Fluent._resolve_url().
+        locale: IETF language tag of the locale to use.
+        fallback_locales: Tuple of IETF language tags to use if the primary locale is
+            not available.
+
+    Returns:
+        Namespace with the DOMLocalization (dom_localization) and the Localization
+        (localization) object.
+    """
+    module = _import_module()
+    fluent = module.init_localization(url_template, locale, fallback_locales)
+
+    if fluent.dom_errors:
+        raise Exception(fluent.dom_errors[0])
+
+    if fluent.main_errors:
+        raise Exception(fluent.main_errors[0])
+
+    # Read each property only once, every access crosses the JS bridge.
+    dom, main = fluent.dom, fluent.main
+    if not dom or not main:
+        raise RuntimeError("Error initializing Localizer.")
+
+    return SimpleNamespace(dom_localization=dom, localization=main)
 
 
 class Message:
@@ -12,6 +67,8 @@ class Message:
     assigned to that attribute automatically.
     """
 
+    __slots__ = ("obj", "attribute", "msg_id", "variables")
+
     def __init__(self, *args, **kwargs):
         """Initialize the Message class.
 
@@ -34,16 +91,20 @@ class Message:
             kwargs: Optional keyworded variables to pass on to fluent (e.g. for
                 placeables or selectors).
         """
-        try:
-            # Assume the user wants to assign the translation to an object attribute.
-            self.obj, self.attribute, self.msg_id = args
-            self.variables = kwargs
-        except ValueError:
+        n = len(args)
+        if n == 1:
             # Assume the user wants to obtain the translated string only.
-            self.obj = None
-            self.attribute = None
+            self.obj = self.attribute = None
             self.msg_id = args[0]
-            self.variables = kwargs
+        elif n == 3:
+            # Assume the user wants to assign the translation to an object attribute.
+            self.obj, self.attribute, self.msg_id = args
+        else:
+            raise TypeError(
+                f"Message expects a message id or object, attribute name and message "
+                f"id, but {n} positional arguments were given."
+            )
+        self.variables = kwargs
 
 
 class Fluent:
@@ -67,54 +128,73 @@ class Fluent:
         for the "es_MX" locale.
     """
 
-    class __JSInterface:
-        """The JavaScript library that is used to interface with fluent creates a
-        "DOMLocalization" and a "Localization" object. You can access it directly
-        using the public Fluent.js attribute.
+    # Maximum number of JS interfaces in the bundle cache. Interfaces that translate
+    # the document are never evicted.
+    _BUNDLE_CACHE_SIZE = 8
 
-        Example:
-            ``
-            fl = Fluent("localization/{locale}/main.ftl", "es_MX", ["es_ES", "en_US"])
-            print(fl.js.formatValue("hello", { name: "John"}))
-            ``
-            This will call the original fluent-dom API.
+    # JS interfaces shared by all instances, least recently used first. Keys are
+    # tuples of the URL template to the .ftl files, the locale and the fallback
+    # locales.
+    _bundle_cache = {}
+
+    # JS interfaces whose DOMLocalization translates the document, by URL template.
+    _connected = {}
+
+    # Incremented whenever the cache is cleared to invalidate the instances' interfaces.
+    _cache_generation = 0
+
+    @classmethod
+    def _evict_bundles(cls):
+        """Drop the least recently used JS interfaces if the cache is full."""
+        connected = {id(js) for js in cls._connected.values()}
+        for key in list(cls._bundle_cache):
+            if len(cls._bundle_cache) <= cls._BUNDLE_CACHE_SIZE:
+                break
+            if id(cls._bundle_cache[key]) not in connected:
+                del cls._bundle_cache[key]
+
+    @classmethod
+    def clear_bundle_cache(cls):
+        """Discard all loaded translations, e.g. after the .ftl files have changed.
+
+        The locales that currently translate the static content of the document are
+        loaded again right away, so that the static content stays translated. Fluent
+        instances use the reloaded translations on their next translation request.
         """
+        connected = [
+            key for key, js in cls._bundle_cache.items()
+            if cls._connected.get(key[0]) is js
+        ]
 
-        ASSET_URL = "./_/theme/"
-        FLUENT_LIB = "fluent_anvil.js"
-
-        def __init__(
-            self,
-            path_template: str,
-            locale: str,
-            fallback_locales: list = None,
-            path_prefix: str = None,
-        ):
-            """Initialize Fluent's DOMLocalization and Localization object."""
-            
-            # Determine the path prefix and ensure it ends with a forward slash.
-            prefix = self.ASSET_URL if path_prefix is None else path_prefix
-            prefix = "" if path_template.startswith(prefix) else prefix
-            prefix = prefix if prefix.endswith("/") else f"{prefix}/"
-
-            self.module = anvil.js.import_from(f"{self.ASSET_URL}{self.FLUENT_LIB}")
-            fluent = self.module.init_localization(
-                f"{prefix}{path_template}", locale, fallback_locales
-            )
-            
-            if fluent.dom_errors:
-                raise Exception(fluent.dom_errors[0])
+        root = anvil.js.window.document.documentElement
+        for js in cls._connected.values():
+            js.dom_localization.disconnectRoot(root)
 
-            if fluent.main_errors:
-                raise Exception(fluent.main_errors[0])
+        cls._connected.clear()
+        cls._bundle_cache.clear()
+        cls._cache_generation += 1
 
-            if not fluent.dom or not fluent.main:
-                raise RuntimeError("Error initializing Localizer.")
+        for key in connected:
+            js = _init_js_interface(*key)
+            cls._bundle_cache[key] = js
+            cls._connected[key[0]] = js
 
-            self.dom_localization = fluent.dom
-            self.localization = fluent.main
+    @classmethod
+    def _resolve_url(cls, path_template: str, path_prefix: str = None) -> str:
+        """Return the template string to the .ftl files including the path prefix.
+
+        The prefix defaults to the asset URL and is only prepended if path_template
+        does not start with it already. A non-empty prefix always ends with a forward
+        slash.
+        """
+        prefix = _ASSET_URL if path_prefix is None else path_prefix
+        if path_template.startswith(prefix):
+            return path_template
+        prefix = prefix if prefix.endswith("/") else f"{prefix}/"
+        return f"{prefix}{path_template}"
 
     @classmethod
+    @lru_cache(maxsize=64)
     def _clean_locale(cls, locale: str):
         """Ensure valid IETF language tags.
 
@@ -123,7 +203,7 @@ class Fluent:
         language tags. Therefore, replace any underscores with hyphens. The JavaScript 
         library will switch to underscore again when loading the assets.
         """
-        return locale.replace("_", "-")
+        return locale.translate(_LOCALE_TRANS)
 
     def __init__(
         self,
@@ -131,6 +211,7 @@ class Fluent:
         locale: str,
         fallback_locales: list = None,
         path_prefix: str = None,
+        lazy: bool = False,
     ):
         """Initialize Fluent.
 
@@ -147,16 +228,91 @@ class Fluent:
             path_prefix: Prefix for the given path. Will be "./_/theme/" if not given.
                 The prefix will be prepended to path_template if not already present.
                 This is meant as a convenience for novice users and reduce typing
-                effort.
+                effort. An empty prefix uses path_template as is, i.e. relative to
+                the current page.
+            lazy: If True, fluent is not initialized before the first translation
+                request or access of Fluent.js. This avoids any initialization cost for
+                instances that might not be used. However, static content will not be
+                translated before then and initialization errors are raised by the
+                first translation request instead of the constructor.
         """
-        self.js = None
-        self._path_template = path_template
-        self._path_prefix = path_prefix
+        self._js = None
+        self._locale = None
+        self._fallback_locales = None
+        self._value_cache = {}
+        self._cache_generation = Fluent._cache_generation
+        self._resolved_url = self._resolve_url(path_template, path_prefix)
+        self._lazy = lazy
         self.set_locale(locale, fallback_locales)
 
+    @property
+    def js(self):
+        """Interface to fluent's DOMLocalization and Localization object.
+
+        The JavaScript library that is used to interface with fluent creates a
+        "DOMLocalization" and a "Localization" object. You can access them directly
+        using the dom_localization and localization attribute.
+
+        Example:
+            ``
+            fl = Fluent("localization/{locale}/main.ftl", "es_MX", ["es_ES", "en_US"])
+            print(fl.js.localization.formatValue("hello", { name: "John"}))
+            ``
+            This will call the original fluent-dom API.
+        """
+        return self._ensure_js()
+
+    def _ensure_js(self):
+        """Initialize fluent for the current locale unless already done."""
+        if self._cache_generation != Fluent._cache_generation:
+            # The bundle cache has been cleared, so translations may have changed.
+            self._cache_generation = Fluent._cache_generation
+            self._js = None
+            self._value_cache.clear()
+
+        if self._js is not None:
+            return self._js
+
+        # Fluent instances using the same .ftl files and locales (e.g. one per form)
+        # share their DOMLocalization instead of loading the .ftl files again.
+        key = (self._resolved_url, self._locale, self._fallback_locales)
+        js = Fluent._bundle_cache.pop(key, None)
+        current = Fluent._connected.get(self._resolved_url)
+        if js is None or js is not current:
+            # Only one locale per set of .ftl files may observe the document.
+            # Otherwise, several DOMLocalization objects would race to translate
+            # inserted elements.
+            root = anvil.js.window.document.documentElement
+            if current is not None:
+                current.dom_localization.disconnectRoot(root)
+
+            if js is None:
+                # A new DOMLocalization connects to the document by itself.
+                js = _init_js_interface(*key)
+            else:
+                js.dom_localization.connectRoot(root)
+                js.dom_localization.translateRoots()
+            Fluent._connected[self._resolved_url] = js
+
+        # Keep the most recently used interfaces at the end of the cache.
+        Fluent._bundle_cache[key] = js
+        Fluent._evict_bundles()
+
+        self._js = js
+        return js
+
     def set_locale(self, locale: str, fallback_locales: list = None):
         """Sets a new locale to translate to.
 
+        Fluent is initialized for the new locale right away, unless the instance is
+        lazy and has not been used yet.
+
+        Fluent instances with the same path template share the translation of static
+        content: Only one locale per path template can translate the document.
+        Therefore, this also switches the static content of all other instances with
+        the same path template, although their format() calls keep using their own
+        locale.
+
         Args:
             locale: The name of the locale to use. Can be written with both hyphen or
                 underscore, e.g. both "en_US" and "en-US" will work.
@@ -165,15 +321,20 @@ class Fluent:
         """
         
         locale = self._clean_locale(locale)
-        fallback_locales = fallback_locales or []
-        fallback_locales = [self._clean_locale(e) for e in fallback_locales]
+        # Tuples are used, because they are hashable.
+        fallback_locales = tuple(map(self._clean_locale, fallback_locales or ()))
+
+        initialized = self._js is not None
+        self._js = None
+        self._locale = locale
+        self._fallback_locales = fallback_locales
 
-        self.js = self.__JSInterface(
-            self._path_template, 
-            locale, 
-            fallback_locales, 
-            self._path_prefix
-        )  
+        # Cached translations belong to the previous locale.
+        self._value_cache.clear()
+
+        # Lazy instances that have not been used yet stay uninitialized.
+        if initialized or not self._lazy:
+            self._ensure_js()
 
     @classmethod
     def get_preferred_locales(cls, fallback: str = None) -> list:
@@ -187,12 +348,52 @@ class Fluent:
         Returns:
             A list of preferred locales (most preferrable first).
         """
-        module_js = anvil.js.import_from(
-            f"{cls.__JSInterface.ASSET_URL}{cls.__JSInterface.FLUENT_LIB}"
-        )
+        # Return a copy so that callers cannot modify the cached result.
+        return list(cls._get_preferred_locales(fallback))
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _get_preferred_locales(cls, fallback: str = None) -> tuple:
+        """Return the user's preferred locales as tuple.
+
+        The user's preferences do not change during a session. Therefore, the result
+        is cached for each fallback locale.
+        """
+        module_js = _import_module()
         fallback = cls._clean_locale(fallback) if fallback else None
         locales = module_js.get_user_locales(fallback)
-        return locales if isinstance(locales, list) else [locales]
+        return tuple(locales) if isinstance(locales, list) else (locales,)
+
+    def _format_cached(self, msg_id: str):
+        """Return the translation of a message id without variables.
+
+        Translations without variables only depend on the locale. Therefore, they are
+        memoized until the locale changes to avoid calling into fluent again for
+        repeated message ids.
+        """
+        value = self._value_cache.get(msg_id, _MISSING)
+        if value is _MISSING:
+            # Omit args so that no empty object is created on the JavaScript side.
+            value = self.js.localization.formatValue(msg_id)
+            self._value_cache[msg_id] = value
+        return value
+
+    def _format_one(self, message: Message):
+        """Translate a single Message instance.
+
+        Uses fluent's formatValue() instead of the batch API to avoid building
+        JavaScript arrays for a single translation. Like format(), a list is returned
+        to keep the return type independent of the number of Message instances.
+        """
+        if message.variables:
+            value = self.js.localization.formatValue(message.msg_id, message.variables)
+        else:
+            value = self._format_cached(message.msg_id)
+
+        if message.obj:
+            setattr(message.obj, message.attribute, value)
+
+        return [value]
 
     def format(self, message, *args, **kwargs):
         """Return a translation for the given message id and variables.
@@ -228,28 +429,88 @@ class Fluent:
             instances are given, a list of translations in the same order.
         """
 
+        # Cached translations are outdated if the bundle cache has been cleared.
+        if self._cache_generation != Fluent._cache_generation:
+            self._ensure_js()
+
         # If a string is given, translate a single value.
         if isinstance(message, str):
             if args:
                 raise ValueError(
                     "Parameter args is not supported if message is a string."
                 )
-            return self.js.localization.formatValue(message, kwargs)
+            if kwargs:
+                return self.js.localization.formatValue(message, kwargs)
+            return self._format_cached(message)
 
         if kwargs:
             raise ValueError(
                 "Parameter kwargs is only supported if message is a string"
             )
 
-        # If multiple Message instances are given, translate all of them.
+        if not args:
+            return self._format_one(message)
+
+        # If multiple Message instances are given, translate all of them. Messages
+        # without variables are served from the cache where possible.
         messages = (message,) + args
-        keys = [{"id": e.msg_id, "args": e.variables} for e in messages]
-        translations = self.js.localization.formatValues(keys)
+        translations = []
+        missing = []
+        keys = []
+        for i, msg in enumerate(messages):
+            if msg.variables:
+                key = {"id": msg.msg_id, "args": msg.variables}
+            else:
+                value = self._value_cache.get(msg.msg_id, _MISSING)
+                if value is not _MISSING:
+                    translations.append(value)
+                    continue
+                # Fluent treats missing args like empty ones, so do not send any.
+                key = {"id": msg.msg_id}
+            translations.append(None)
+            missing.append(i)
+            keys.append(key)
+
+        if keys:
+            for i, value in zip(missing, self.js.localization.formatValues(keys)):
+                translations[i] = value
+                if not messages[i].variables:
+                    self._value_cache[messages[i].msg_id] = value
 
         # If Message instances reference an object attribute, set the translations.
-        for i, msg in enumerate(messages):
+        for msg, value in zip(messages, translations):
             if msg.obj:
-                setattr(msg.obj, msg.attribute, translations[i])
+                setattr(msg.obj, msg.attribute, value)
 
         # Return all translations.
         return translations
+
+    def compile(self, msg_id: str):
+        """Return a function that translates the given message id.
+
+        The returned function skips the argument handling of format(). This is useful
+        if the same message is translated repeatedly with varying variables, e.g. when
+        rendering lists. Like format(), it always uses the current locale and caches
+        translations without variables.
+
+        Example:
+            ``
+            fl = Fluent("localization/{locale}/main.ftl", "es_MX", ["en_US"])
+            hello = fl.compile("hello")
+            print([hello(name=name) for name in ("John", "Jane")])
+            ``
+
+        Args:
+            msg_id: The message id to translate.
+
+        Returns:
+            A function accepting keyworded variables to pass on to Fluent and returning
+            the translation.
+        """
+
+        def translate(**kwargs):
+            if kwargs:
+                return self.js.localization.formatValue(msg_id, kwargs)
+            return self._format_cached(msg_id)
+
+        return translate